@@ -1,3 +1,3 @@
-from .settings import settings
+from .settings import Settings, get_settings, settings
 
-__all__ = ["settings"]
+__all__ = ["Settings", "get_settings", "settings"]
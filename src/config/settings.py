@@ -1,14 +1,31 @@
+import threading
 from functools import lru_cache
-from typing import Optional
+from typing import Any, ClassVar, Optional
 
-from pydantic_settings import BaseSettings
+from dotenv import dotenv_values
+from pydantic_settings import (
+    BaseSettings,
+    InitSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+
+ENV_FILE = ".env"
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
+    # No env_file here: .env is read once by load_env_file() and fed in as a
+    # settings source (see settings_customise_sources), so building Settings
+    # never touches the filesystem.
+    model_config = SettingsConfigDict(
+        extra="ignore",
+        frozen=True,
+    )
+
     # API Configuration
-    app_name: str = "AI Council API"
+    app_name: ClassVar[str] = "AI Council API"
     debug: bool = False
 
     # Gemini Configuration
@@ -16,22 +33,73 @@ class Settings(BaseSettings):
     council_gemini_model: str = "gemini-2.0-flash-exp"
     dev_team_gemini_model: str = "gemini-2.0-flash-exp"
 
+    # Council response cache (0 disables it)
+    council_cache_ttl_seconds: int = 86400
+
     # GitHub Publishing (Dev Team)
     github_user: Optional[str] = None
     github_token: Optional[str] = None
     git_user_email: Optional[str] = None
     git_user_name: Optional[str] = None
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        extra = "ignore"
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        # Real environment variables win over .env, whose values are never
+        # exported to os.environ: agent shell commands and git inherit the
+        # environment and must not see GITHUB_TOKEN or GEMINI_API_KEY from it.
+        return (
+            init_settings,
+            env_settings,
+            InitSettingsSource(settings_cls, dict(load_env_file())),
+            file_secret_settings,
+        )
+
+
+@lru_cache(maxsize=1)
+def load_env_file() -> dict[str, str]:
+    """Read the .env file once, keyed by lower-cased field name; os.environ is left untouched."""
+    values = dotenv_values(ENV_FILE, encoding="utf-8")
+    return {key.lower(): value for key, value in values.items() if value is not None}
+
+
+_settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
 
 
-@lru_cache
 def get_settings() -> Settings:
-    """Cached settings instance."""
-    return Settings()
+    """Process-wide settings instance, built on first use."""
+    instance = _settings
+    if instance is not None:
+        return instance
+    return _init_settings()
+
+
+def _init_settings() -> Settings:
+    """Build the settings exactly once, even if several threads race here."""
+    global _settings
+    with _settings_lock:
+        if _settings is None:
+            _settings = Settings()
+        return _settings
+
+
+class _LazySettings:
+    """Module-level ``settings`` handle that builds the settings on first attribute access."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+    def __repr__(self) -> str:
+        return repr(get_settings())
 
 
-settings = get_settings()
+settings = _LazySettings()
@@ -1,3 +1,4 @@
-from .agents import create_council_team
+from .agents import create_council_team, warm_up_council
+from .cache import get_conclusion_cache
 
-__all__ = ["create_council_team"]
+__all__ = ["create_council_team", "get_conclusion_cache", "warm_up_council"]
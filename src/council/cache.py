@@ -0,0 +1,72 @@
+"""
+Council cache module.
+
+Keeps recent debate conclusions in memory, keyed by the normalized note text,
+so resubmitting an idea returns the earlier verdict instead of running a
+second full multi-agent debate.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+
+from src.config import settings
+
+_CACHE_SIZE = 256
+
+
+class ConclusionCache:
+    """Thread-safe LRU of council conclusions with a time-to-live."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = _CACHE_SIZE):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # sha256 of the normalized note -> (expires_at, conclusion)
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    @staticmethod
+    def _key(content: str) -> str:
+        """Case and whitespace differences do not make a note a different idea."""
+        normalized = " ".join(content.split()).casefold()
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def get(self, content: str) -> Optional[str]:
+        """Return the cached conclusion for this note, or None on a miss."""
+        if not self.enabled:
+            return None
+        key = self._key(content)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, conclusion = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return conclusion
+
+    def put(self, content: str, conclusion: str) -> None:
+        """Store a conclusion for this note, evicting the least recently used."""
+        if not self.enabled or not conclusion:
+            return
+        key = self._key(content)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, conclusion)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def get_conclusion_cache() -> ConclusionCache:
+    """Process-wide conclusion cache, sized from settings on first use."""
+    return ConclusionCache(ttl_seconds=settings.council_cache_ttl_seconds)
@@ -1,3 +1,3 @@
-from .agents import create_dev_team
+from .agents import create_dev_team, warm_up_dev_team
 
-__all__ = ["create_dev_team"]
+__all__ = ["create_dev_team", "warm_up_dev_team"]
@@ -0,0 +1,52 @@
+"""
+Dev Team tools module.
+
+Toolkit variants used by the pipeline agents. Imported lazily by
+src.dev_team.agents so agno is only loaded when agents are built.
+"""
+
+import threading
+from collections import OrderedDict
+
+from agno.tools.file import FileTools
+
+_READ_CACHE_SIZE = 64
+
+# (resolved path, encoding, mtime_ns, size) -> read_file result, shared by all
+# agents so architecture.md and the reports are read from disk once per version.
+_read_cache: "OrderedDict[tuple[str, str, int, int], str]" = OrderedDict()
+_read_cache_lock = threading.Lock()
+
+
+class CachedFileTools(FileTools):
+    """FileTools whose read_file serves unchanged files from an in-memory LRU cache."""
+
+    def read_file(self, file_name: str, encoding: str = "utf-8") -> str:
+        """Reads the contents of the file `file_name` and returns the contents if successful.
+
+        :param file_name: The name of the file to read.
+        :param encoding: Encoding to use, default - utf-8
+        :return: The contents of the file if successful, otherwise returns an error message.
+        """
+        file_path = self.base_dir / file_name
+        try:
+            stat = file_path.stat()
+            key = (str(file_path.resolve()), encoding, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return super().read_file(file_name, encoding)
+
+        with _read_cache_lock:
+            cached = _read_cache.get(key)
+            if cached is not None:
+                _read_cache.move_to_end(key)
+                return cached
+
+        # Misses go through FileTools so its path and size checks still apply;
+        # only successful reads are cached.
+        contents = super().read_file(file_name, encoding)
+        if not contents.startswith("Error reading file"):
+            with _read_cache_lock:
+                _read_cache[key] = contents
+                while len(_read_cache) > _READ_CACHE_SIZE:
+                    _read_cache.popitem(last=False)
+        return contents
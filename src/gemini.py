@@ -0,0 +1,25 @@
+"""
+Shared Gemini client module.
+
+Every agno Gemini model in the app (council and dev team) is backed by one
+google-genai client, so all Gemini calls share its HTTP connection pools
+instead of paying a TLS handshake per model instance.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from src.config import settings
+
+if TYPE_CHECKING:
+    from google import genai
+
+
+@lru_cache(maxsize=1)
+def get_genai_client() -> genai.Client:
+    """Process-wide google-genai client, built on first use."""
+    from google import genai
+
+    return genai.Client(api_key=settings.gemini_api_key)
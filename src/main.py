@@ -6,22 +6,41 @@ to debate and evaluate ideas.
 """
 
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.config import settings
+from src.council import warm_up_council
+from src.dev_team import create_dev_team, warm_up_dev_team
 from src.routers import council_router, dev_team_router
 from src.middleware import RequestLoggingMiddleware
 
-# Configure logging
+# Configure logging. force=True replaces handlers a server may already have
+# put on the root logger, which would otherwise make this a silent no-op and
+# drop the DEBUG level. It must run before RequestLoggingMiddleware installs
+# its root handler when the app starts, so it stays at import time.
 logging.basicConfig(
     level=logging.DEBUG if settings.debug else logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    force=True,
 )
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build request-independent objects once, before the first request."""
+    # The dev pipeline keeps no per-run state, so one instance serves every
+    # request. Council teams stay per request: agno's Team holds run state.
+    app.state.dev_team = create_dev_team()
+    warm_up_council()
+    warm_up_dev_team()
+    logger.info("Startup complete: agno loaded and Gemini models ready")
+    yield
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.app_name,
@@ -32,6 +51,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -1,89 +1,163 @@
+import contextvars
+import itertools
 import logging
+import os
 import sys
+import threading
 import time
-import uuid
 from pathlib import Path
+from typing import AsyncIterator, Optional, TextIO
+
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
- 
 
-# Configure the logs directory
+logger = logging.getLogger(__name__)
+
+# Logs directory, created when request logging is installed
 LOGS_DIR = Path("logs")
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
+
+# Health and info probes are answered without creating a request log.
+UNLOGGED_PATHS = frozenset({"/", "/health"})
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Request logs are written through one buffered handle and flushed when the
+# request ends (or on an error record), not on every line.
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Log file of the request being handled in the current context. asyncio tasks
+# and asyncio.to_thread copy the context, so work spawned by a request keeps
+# writing to that request's file while concurrent requests stay separate.
+_request_log: contextvars.ContextVar[Optional[TextIO]] = contextvars.ContextVar("request_log", default=None)
+
+# Per-process request counter; with the pid it makes request ids unique
+# across workers without drawing random bytes for every request.
+_request_counter = itertools.count(1)
+
+_install_lock = threading.Lock()
+_installed = False
+
+
+def _current_log() -> Optional[TextIO]:
+    log_file = _request_log.get()
+    if log_file is None or log_file.closed:
+        return None
+    return log_file
+
+
+class _RequestLogHandler(logging.Handler):
+    """Root handler that writes each record to the current request's log file.
+
+    Errors are flushed right away so they reach disk even if the process dies
+    before the request finishes.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        log_file = _current_log()
+        if log_file is None:
+            return
+        try:
+            log_file.write(self.format(record) + "\n")
+            if record.levelno >= logging.ERROR:
+                log_file.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class _RequestTee:
+    """
+    Stream wrapper that copies stdout/stderr into the current request's log file.
+
+    agno's debug output is printed (rich) rather than logged, so the streams
+    are teed as well as the root logger.
+    """
+
+    def __init__(self, original: TextIO):
+        self.original = original
+
+    def write(self, message: str) -> int:
+        written = self.original.write(message)
+        log_file = _current_log()
+        if log_file is not None:
+            log_file.write(message)
+        return written
+
+    def flush(self) -> None:
+        # Only the console is flushed; the log file is flushed at request end.
+        self.original.flush()
+
+    def isatty(self) -> bool:
+        return getattr(self.original, "isatty", lambda: False)()
+
+    def __getattr__(self, name: str):
+        return getattr(self.original, name)
+
+
+def install_request_logging() -> None:
+    """Install the request log handler and the stdout/stderr tees, once per process."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
+        handler = _RequestLogHandler(level=logging.DEBUG)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        logging.getLogger().addHandler(handler)
+        sys.stdout = _RequestTee(sys.stdout)
+        sys.stderr = _RequestTee(sys.stderr)
+        _installed = True
+
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
+    """Writes the logs and console output of each request to logs/<timestamp>_<id>.log."""
+
+    def __init__(self, app):
+        super().__init__(app)
+        install_request_logging()
+
     async def dispatch(self, request: Request, call_next):
-        if request.url.path == "/health":
+        if request.url.path in UNLOGGED_PATHS:
             return await call_next(request)
 
-        # Generate a unique ID for the request
-        request_id = str(uuid.uuid4())[:8]
+        # Unique ID for the request: <pid>-<sequence>
+        request_id = f"{os.getpid():x}-{next(_request_counter)}"
         timestamp = time.strftime("%Y%m%d_%H%M%S")
-        log_filename = f"{timestamp}_{request_id}.log"
-        log_filepath = LOGS_DIR / log_filename
-        
-        # Create a file to write logs to
-        # We use a custom stream that writes to both the file and the original stream
-        # so we don't lose console output.
-        
+        log_filepath = LOGS_DIR / f"{timestamp}_{request_id}.log"
+
         try:
-            with open(log_filepath, "a", buffering=1) as log_file:
-                # 1. Capture Python Logging
-                file_handler = logging.FileHandler(log_filepath)
-                file_handler.setLevel(logging.DEBUG)
-                formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-                file_handler.setFormatter(formatter)
-                
-                root_logger = logging.getLogger()
-                root_logger.addHandler(file_handler)
-                
-                # 2. Capture Stdout/Stderr (e.g. for prints or rich output)
-                # We define a helper class to tee the output
-                class Tee:
-                    def __init__(self, original, file):
-                        self.original = original
-                        self.file = file
-                        
-                    def write(self, message):
-                        self.original.write(message)
-                        self.file.write(message)
-                        self.file.flush()
-                        
-                    def flush(self):
-                        self.original.flush()
-                        self.file.flush()
-                        
-                    def isatty(self):
-                        return getattr(self.original, 'isatty', lambda: False)()
-                
-                original_stdout = sys.stdout
-                original_stderr = sys.stderr
-                
-                sys.stdout = Tee(original_stdout, log_file)
-                sys.stderr = Tee(original_stderr, log_file)
-                
-                # Add request_id to context if needed, or just log start
-                logging.info(f"Starting request {request_id} - {request.method} {request.url}")
-                
-                try:
-                    response = await call_next(request)
-                    return response
-                except Exception as e:
-                    logging.exception(f"Request failed: {e}")
-                    raise
-                finally:
-                    # Cleanup
-                    logging.info(f"Finished request {request_id}")
-                    
-                    # Remove handler
-                    root_logger.removeHandler(file_handler)
-                    file_handler.close()
-                    
-                    # Restore streams
-                    sys.stdout = original_stdout
-                    sys.stderr = original_stderr
-                    
-        except Exception as e:
-            # Fallback if logging setup fails
-            print(f"Failed to setup logging for request: {e}")
+            log_file = open(log_filepath, "a", encoding="utf-8", buffering=LOG_BUFFER_SIZE)
+        except OSError as e:
+            # Fallback if the log file cannot be created
+            logger.warning("Failed to set up logging for request: %s", e)
             return await call_next(request)
+
+        token = _request_log.set(log_file)
+        response = None
+        try:
+            logger.info("Starting request %s - %s %s", request_id, request.method, request.url)
+            response = await call_next(request)
+        except Exception as e:
+            logger.exception("Request failed: %s", e)
+            raise
+        finally:
+            # No response (an error, or cancellation on disconnect/shutdown):
+            # the request is over, so finish and close the log here.
+            if response is None:
+                logger.info("Finished request %s", request_id)
+                _request_log.reset(token)
+                log_file.close()
+
+        # A streamed body is still being produced after dispatch returns, so
+        # the log stays current for this request's task until it is sent.
+        response.body_iterator = _close_log_after(response.body_iterator, log_file, request_id)
+        return response
+
+
+async def _close_log_after(body: AsyncIterator[bytes], log_file: TextIO, request_id: str) -> AsyncIterator[bytes]:
+    """Pass the response body through, then finish and close the request log."""
+    try:
+        async for chunk in body:
+            yield chunk
+    finally:
+        logger.info("Finished request %s", request_id)
+        log_file.close()
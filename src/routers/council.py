@@ -1,14 +1,17 @@
 """
 Council router module.
 
-Defines the /call_council endpoint for running council debates.
+Defines the /call_council endpoints for running council debates.
 """
 
+import json
 import logging
+from typing import AsyncIterator
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
-from src.council import create_council_team
+from src.council import create_council_team, get_conclusion_cache
 from src.models import NoteInput, CouncilResponse
 
 logger = logging.getLogger(__name__)
@@ -16,6 +19,34 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/council", tags=["council"])
 
 
+def _debate_prompt(content: str) -> str:
+    return f"Here is the idea to evaluate:\n\n{content}"
+
+
+def _conclusion_of(run_output) -> str:
+    """
+    Content of a finished debate.
+
+    agno reports model failures (e.g. 503 UNAVAILABLE) through the run status,
+    with the error text as content, rather than raising; anything but a
+    completed run is turned into an error here so it is never cached or
+    returned as a verdict.
+    """
+    from agno.run.base import RunStatus
+
+    if run_output is None:
+        raise RuntimeError("council run produced no output")
+    if run_output.status != RunStatus.completed:
+        status = getattr(run_output.status, "value", run_output.status)
+        raise RuntimeError(f"council run ended with status {status}: {run_output.content}")
+    return run_output.content
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 @router.post(
     "/call_council",
     response_model=CouncilResponse,
@@ -50,18 +81,30 @@ async def call_council(note: NoteInput) -> CouncilResponse:
     try:
         logger.info("Starting council debate for note: %s...", note.content[:50])
 
+        # The same idea gets the same verdict; skip the debate on a repeat
+        conclusion_cache = get_conclusion_cache()
+        cached = conclusion_cache.get(note.content)
+        if cached is not None:
+            logger.info("Council conclusion served from cache")
+            return CouncilResponse(
+                status="success",
+                conclusion=cached,
+            )
+
         # Create fresh council team for each request to prevent state leakage
         council_team = create_council_team()
 
-        # Run the debate
-        prompt = f"Here is the idea to evaluate:\n\n{note.content}"
-        response = council_team.run(prompt)
+        # Run the debate. On the async path agno executes the moderator's
+        # parallel delegations concurrently, so the voters' turns overlap.
+        response = await council_team.arun(_debate_prompt(note.content))
+        conclusion = _conclusion_of(response)
 
         logger.info("Council debate completed successfully")
+        conclusion_cache.put(note.content, conclusion)
 
         return CouncilResponse(
             status="success",
-            conclusion=response.content,
+            conclusion=conclusion,
         )
 
     except Exception as e:
@@ -70,3 +113,75 @@ async def call_council(note: NoteInput) -> CouncilResponse:
             status_code=500,
             detail=f"Council debate failed: {str(e)}",
         ) from e
+
+
+@router.post(
+    "/call_council/stream",
+    response_class=StreamingResponse,
+    summary="Run a council debate (streamed)",
+    description=(
+        "Same debate as /call_council, streamed as Server-Sent Events: `progress` when the moderator "
+        "calls a tool (e.g. delegates to a member), `delta` chunks of the moderator's output, then "
+        "`done` with the CouncilResponse, or `error` if the debate fails."
+    ),
+)
+async def call_council_stream(note: NoteInput) -> StreamingResponse:
+    """
+    Run a council debate on the provided note, streaming progress as it happens.
+
+    Args:
+        note: The input note containing the idea to debate.
+
+    Returns:
+        StreamingResponse of text/event-stream events.
+    """
+    logger.info("Starting streamed council debate for note: %s...", note.content[:50])
+    return StreamingResponse(
+        _stream_debate(note.content),
+        media_type="text/event-stream",
+        # Tell proxies not to buffer the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _stream_debate(content: str) -> AsyncIterator[str]:
+    """Yield SSE events for one debate; errors become an `error` event, since headers are already sent."""
+    conclusion_cache = get_conclusion_cache()
+    cached = conclusion_cache.get(content)
+    if cached is not None:
+        logger.info("Council conclusion served from cache")
+        yield _sse("done", CouncilResponse(status="success", conclusion=cached).model_dump())
+        return
+
+    try:
+        from agno.run.team import TeamRunEvent, TeamRunOutput
+
+        council_team = create_council_team()
+        run_output = None
+
+        # Member events are streamed too; only the moderator's are forwarded.
+        # The final TeamRunOutput (yield_run_output) carries the run status.
+        async for event in council_team.arun(
+            _debate_prompt(content), stream=True, stream_events=True, yield_run_output=True
+        ):
+            if isinstance(event, TeamRunOutput):
+                run_output = event
+                continue
+            kind = getattr(event, "event", None)
+            if kind == TeamRunEvent.run_content.value:
+                if isinstance(event.content, str) and event.content:
+                    yield _sse("delta", {"delta": event.content})
+            elif kind == TeamRunEvent.tool_call_started.value and event.tool is not None:
+                yield _sse("progress", {"tool": event.tool.tool_name, "args": event.tool.tool_args})
+            elif kind == TeamRunEvent.run_error.value:
+                raise RuntimeError(event.content or "council run failed")
+
+        conclusion = _conclusion_of(run_output)
+
+        logger.info("Council debate completed successfully")
+        conclusion_cache.put(content, conclusion)
+        yield _sse("done", CouncilResponse(status="success", conclusion=conclusion).model_dump())
+
+    except Exception as e:
+        logger.exception("Council debate failed: %s", str(e))
+        yield _sse("error", {"detail": f"Council debate failed: {str(e)}"})
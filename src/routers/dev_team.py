@@ -6,9 +6,8 @@ Defines the /build_poc endpoint for running the virtual dev team.
 
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 
-from src.dev_team import create_dev_team
 from src.models import NoteInput, DevTeamResponse
 
 logger = logging.getLogger(__name__)
@@ -22,7 +21,7 @@ router = APIRouter(prefix="/dev_team", tags=["dev_team"])
     summary="Build a Proof of Concept",
     description="Submit a request for the dev team to build a PoC. They will write files to the workspace.",
 )
-async def build_poc(note: NoteInput) -> DevTeamResponse:
+async def build_poc(note: NoteInput, request: Request) -> DevTeamResponse:
     """
     Run the dev team on the provided request.
 
@@ -34,6 +33,7 @@ async def build_poc(note: NoteInput) -> DevTeamResponse:
 
     Args:
         note: The input request describing the PoC to build.
+        request: The incoming request, used to reach the app-wide pipeline.
 
     Returns:
         DevTeamResponse with the execution result.
@@ -44,13 +44,13 @@ async def build_poc(note: NoteInput) -> DevTeamResponse:
     try:
         logger.info("Starting dev team for request: %s...", note.content[:50])
 
-        # Create fresh team for each request
-        team_leader = create_dev_team()
+        # Shared pipeline built at startup; it keeps no state between runs
+        team_leader = request.app.state.dev_team
 
         # Run the team
         # We give a clear prompt to start the process
         prompt = f"User Request: {note.content}\n\nPlease start the development process."
-        response = team_leader.run(prompt)
+        response = await team_leader.arun(prompt)
 
         logger.info("Dev team execution completed successfully")
 